@@ -13,13 +13,30 @@ For command-line usage:
     $ jo -o _posts Vienna.txt  # short alias
 """
 
-from .builder import Builder, build, build_file
-from .parser import Parser, ParserError
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .version import __version__, get_banner, get_version
 
+if TYPE_CHECKING:
+    from .builder import Builder, build, build_file
+    from .parser import Entry, Parser, ParserError
+
+# The builder and parser (and with them PyYAML) are imported on first use,
+# so that e.g. "journaltxt --version" does not load them
+_LAZY_ATTRS = {
+    "Builder": "builder",
+    "build": "builder",
+    "build_file": "builder",
+    "Entry": "parser",
+    "Parser": "parser",
+    "ParserError": "parser",
+}
+
 __all__ = [
     "Parser",
     "ParserError",
+    "Entry",
     "Builder",
     "build",
     "build_file",
@@ -27,3 +44,19 @@ __all__ = [
     "get_version",
     "get_banner",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from the builder and parser modules on demand."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily imported names."""
+    return sorted({*globals(), *__all__})
@@ -1,23 +1,77 @@
 """Builder for converting Journal.TXT entries to Jekyll posts."""
 
-from datetime import datetime
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import yaml
 
-from .parser import Parser
+try:
+    from yaml import CDumper as _Dumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    import warnings
+
+    from yaml import Dumper as _Dumper
+
+    warnings.warn(
+        "PyYAML was built without libyaml; falling back to the slower "
+        "pure-Python YAML implementation (install libyaml-dev and reinstall "
+        "PyYAML to fix)",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+from .parser import Entry, Parser
 from .version import __version__
 
+# Strings that can be written as plain (unquoted) YAML scalars: they start
+# with a letter and contain no YAML indicator characters
+_PLAIN_STR_RE = re.compile(r"[^\W\d_][^:#'\"\[\]{}&*!|>%@`\\]*")
+
+# Flags for creating or truncating output files (O_BINARY stops Windows from
+# translating newlines)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# English weekday and month abbreviations for page titles (strftime's %a and
+# %b follow the locale, and %-d is not supported on Windows)
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+# Words YAML resolves to booleans or null when left unquoted
+_RESERVED_WORDS = frozenset(
+    {"y", "n", "yes", "no", "true", "false", "on", "off", "null"}
+)
+
 
 class Builder:
     """Builds Jekyll posts from Journal.TXT entries."""
 
-    DEFAULTS = {
-        "outpath": ".",
-        "date": True,  # include date in (auto-)title
-        "verbose": False,
-        "name": "Journal",
-    }
+    # Read-only so that no instance can change the defaults of all others
+    DEFAULTS = MappingProxyType(
+        {
+            "outpath": ".",
+            "date": True,  # include date in (auto-)title
+            "verbose": False,
+            "name": "Journal",
+        }
+    )
 
     def __init__(self, **opts):
         """Initialize builder with options.
@@ -28,7 +82,8 @@ class Builder:
             date: Include date in page title (default: True)
             verbose: Show debug messages (default: False)
         """
-        self.opts = {**self.DEFAULTS, **opts}
+        self.opts = dict(self.DEFAULTS)
+        self.opts.update(opts)
 
     def build_file(self, path: str | Path, **opts) -> None:
         """Build Jekyll posts from a Journal.TXT file.
@@ -39,19 +94,13 @@ class Builder:
         """
         path = Path(path)
 
-        # Read file with UTF-8 encoding, removing BOM if present
-        with open(path, encoding="utf-8-sig") as f:
-            text = f.read()
-
-        # Get basename without .txt extension for default name
-        basename = path.stem
-
-        # Use basename as name if not user-supplied
-        build_opts = {**self.opts, **opts}
+        # Use basename (without .txt extension) as name if not user-supplied
+        build_opts = self.opts.copy()
+        build_opts.update(opts)
         if "name" not in opts:
-            build_opts["name"] = basename
+            build_opts["name"] = path.stem
 
-        self.build(text, **build_opts)
+        self._build_items(Parser.parse_file(path), build_opts)
 
     def build(self, text: str, **opts) -> None:
         """Build Jekyll posts from Journal.TXT text.
@@ -60,8 +109,17 @@ class Builder:
             text: Journal.TXT formatted text
             **opts: Build options (outpath, name, date, verbose)
         """
-        build_opts = {**self.opts, **opts}
+        build_opts = self.opts.copy()
+        build_opts.update(opts)
+        self._build_items(Parser.parse_text(text), build_opts)
 
+    def _build_items(self, items: list[Entry], build_opts: dict[str, Any]) -> None:
+        """Build Jekyll posts from parsed Journal.TXT entries.
+
+        Args:
+            items: Parsed (metadata, content) entries
+            build_opts: Build options (outpath, name, date, verbose)
+        """
         outpath = Path(build_opts["outpath"])
         name = build_opts["name"]
         add_date = build_opts["date"]
@@ -71,9 +129,6 @@ class Builder:
             print(":: Opts :::")
             print(build_opts)
 
-        # Parse entries
-        items = Parser.parse_text(text)
-
         # Add page titles to metadata
         for i, (page_meta, _) in enumerate(items):
             page_date = page_meta["date"]
@@ -87,47 +142,156 @@ class Builder:
 
             if add_date:
                 # Format: "Mon, 17 Jul"
-                page_title += f" - {page_date.strftime('%a, %-d %b')}"
+                page_title += (
+                    f" - {_WEEKDAYS[page_date.weekday()]}, "
+                    f"{page_date.day} {_MONTHS[page_date.month - 1]}"
+                )
 
             page_meta["title"] = page_title
 
-        # Write entries to files
-        for i, (page_meta, page_content) in enumerate(items):
-            page_date = page_meta["date"]
-            page_title = page_meta["title"]
+        if not items:
+            return
 
-            # Build output path: YYYY-MM-DD-name.md
-            filename = f"{page_date}-{name.lower()}.md"
-            filepath = outpath / filename
+        # Create output directory if it doesn't exist
+        outpath.mkdir(parents=True, exist_ok=True)
 
-            # Create output directory if it doesn't exist
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+        total = len(items)
+        slug = name.lower()
+        built_on = datetime.now().isoformat(sep=" ", timespec="seconds")
 
-            print(f"Writing entry {i + 1}/{len(items)} >{page_title}< to {filepath}...")
+        # Build output paths: YYYY-MM-DD-name.md
+        filepaths = [
+            outpath / f"{page_meta['date']}-{slug}.md" for page_meta, _ in items
+        ]
 
-            # Create comment for YAML header
-            comment = (
-                f"Journal.TXT entry {i + 1}/{len(items)} - "
-                f"auto-built on {datetime.now()} by journaltxt/{__version__}"
-            )
+        # Entries sharing a date share a file; like writing them one after
+        # another, only the last of them is kept
+        last_entry = {filepath: i for i, filepath in enumerate(filepaths)}
+
+        # Write entries to files; the writes are independent, so overlap
+        # their I/O on a thread pool
+        with ThreadPoolExecutor(max_workers=min(32, len(last_entry))) as executor:
+            futures = []
+            for i, (page_meta, page_content) in enumerate(items):
+                page_title = page_meta["title"]
+                filepath = filepaths[i]
+
+                print(f"Writing entry {i + 1}/{total} >{page_title}< to {filepath}...")
+                if last_entry[filepath] != i:
+                    continue
+
+                # Create comment for YAML header
+                comment = (
+                    f"Journal.TXT entry {i + 1}/{total} - "
+                    f"auto-built on {built_on} by journaltxt/{__version__}"
+                )
+
+                futures.append(
+                    executor.submit(
+                        _write_entry, filepath, page_meta, page_content, comment
+                    )
+                )
 
-            # Convert metadata to YAML
-            yaml_text = yaml.dump(
-                page_meta,
+            # Re-raise the first write error, if any
+            for future in futures:
+                future.result()
+
+
+def _write_entry(
+    filepath: Path, page_meta: dict[str, Any], page_content: str, comment: str
+) -> None:
+    """Write a single Jekyll post.
+
+    Args:
+        filepath: Output file path
+        page_meta: Entry metadata, written as YAML frontmatter
+        page_content: Entry content
+        comment: Comment placed at the top of the YAML frontmatter
+    """
+    # Convert metadata to YAML
+    yaml_text = _dump_frontmatter(page_meta)
+
+    # Add comment to YAML header
+    yaml_text = f"# {comment}\n{yaml_text}"
+
+    # Write Jekyll post with YAML frontmatter, encoded once and written
+    # straight to the file descriptor without a file object
+    payload = f"---\n{yaml_text}---\n\n{page_content}".encode()
+    fd = os.open(filepath, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            # os.write() may write only part of the buffer
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _dump_frontmatter(meta: dict[str, Any]) -> str:
+    """Convert entry metadata to YAML.
+
+    Plain strings, integers, booleans, None, dates and lists of those are
+    written directly; anything else is handed to yaml.dump.
+
+    Args:
+        meta: Entry metadata
+
+    Returns:
+        YAML text with one top-level key per metadata field
+    """
+    lines = []
+    for key, value in meta.items():
+        if _is_plain_str(key):
+            if isinstance(value, list):
+                items = [_format_scalar(item) for item in value]
+                if items and None not in items:
+                    lines.append(f"{key}:\n")
+                    lines.extend(f"- {item}\n" for item in items)
+                    continue
+            else:
+                scalar = _format_scalar(value)
+                if scalar is not None:
+                    lines.append(f"{key}: {scalar}\n")
+                    continue
+
+        lines.append(
+            yaml.dump(
+                {key: value},
+                Dumper=_Dumper,
                 default_flow_style=False,
                 allow_unicode=True,
                 sort_keys=False,
             )
-
-            # Add comment to YAML header
-            yaml_text = f"# {comment}\n{yaml_text}"
-
-            # Write Jekyll post with YAML frontmatter
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write("---\n")
-                f.write(yaml_text)
-                f.write("---\n\n")
-                f.write(page_content)
+        )
+
+    return "".join(lines)
+
+
+def _format_scalar(value: Any) -> str | None:
+    """Format a scalar as YAML, or return None if it needs yaml.dump."""
+    value_type = type(value)
+    if value_type is str:
+        return value if _is_plain_str(value) else None
+    if value_type is bool:
+        return "true" if value else "false"
+    if value_type is int:
+        return str(value)
+    if value_type is date:
+        return value.isoformat()
+    if value is None:
+        return "null"
+    return None
+
+
+def _is_plain_str(value: Any) -> bool:
+    """Check whether a value is a string YAML reads back unchanged unquoted."""
+    return (
+        type(value) is str
+        and _PLAIN_STR_RE.fullmatch(value) is not None
+        and value.isprintable()
+        and not value.endswith(" ")
+        and value.lower() not in _RESERVED_WORDS
+    )
 
 
 def build_file(path: str | Path, **opts) -> None:
@@ -137,8 +301,8 @@ def build_file(path: str | Path, **opts) -> None:
         path: Path to Journal.TXT file
         **opts: Build options
     """
-    builder = Builder(**opts)
-    builder.build_file(path, **opts)
+    # Options are merged with the defaults once, in Builder.build_file
+    Builder().build_file(path, **opts)
 
 
 def build(text: str, **opts) -> None:
@@ -148,5 +312,4 @@ def build(text: str, **opts) -> None:
         text: Journal.TXT formatted text
         **opts: Build options
     """
-    builder = Builder(**opts)
-    builder.build(text, **opts)
+    Builder().build(text, **opts)
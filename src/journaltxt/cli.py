@@ -1,82 +1,169 @@
 """Command-line interface for journaltxt."""
 
-import argparse
+import re
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import NoReturn
 
-from .builder import build_file
 from .version import __version__
 
+_USAGE = """\
+usage: journaltxt [-h] [-v] [-o PATH] [-n NAME] [--date] [--no-date]
+                  [--version]
+                  [FILE ...]
+"""
+
+_HELP = f"""\
+{_USAGE}
+Build Jekyll blog posts from Journal.TXT single-file format
+
+positional arguments:
+  FILE                  Journal.TXT files to process (default: journal.txt)
+
+options:
+  -h, --help            show this help message and exit
+  -v, --verbose         Show debug messages
+  -o PATH, --output PATH
+                        Output directory path (default: .)
+  -n NAME, --name NAME  Journal name (default: derived from filename)
+  --date                Add date to page title (default: true)
+  --no-date             Do not add date to page title
+  --version             show program's version number and exit
+
+Example: journaltxt -o _posts Vienna.txt
+See https://journaltxt.github.io for more information
+"""
+
+# Options taking a value, mapped to (attribute name, name used in errors)
+_VALUE_OPTIONS = {
+    "-o": ("outpath", "-o/--output"),
+    "--output": ("outpath", "-o/--output"),
+    "-n": ("name", "-n/--name"),
+    "--name": ("name", "-n/--name"),
+}
+
+# Arguments that look like negative numbers are values, not options (as in
+# argparse, since no option looks like one)
+_NEGATIVE_NUMBER_RE = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+# Short options taking no value, which may be clustered with other short
+# options
+_SHORT_FLAGS = frozenset("hv")
+
+
+class CommandLineParser:
+    """Argument parser for the journaltxt CLI.
+
+    A small hand-written replacement for argparse, which costs more to
+    import and set up than parsing these few options takes. Accepts the
+    same options and prints the same help, usage and error messages.
+    """
 
-def create_parser() -> argparse.ArgumentParser:
+    prog = "journaltxt"
+    description = "Build Jekyll blog posts from Journal.TXT single-file format"
+
+    def parse_args(self, argv: list[str] | None = None) -> SimpleNamespace:
+        """Parse command-line arguments.
+
+        Args:
+            argv: Command-line arguments (default: sys.argv[1:])
+
+        Returns:
+            Namespace with files, verbose, outpath, name and date attributes
+
+        Raises:
+            SystemExit: For --help and --version (code 0) and for invalid
+                arguments (code 2)
+        """
+        # Copied, as clustered short flags are split up in place
+        argv = list(sys.argv[1:] if argv is None else argv)
+
+        args = SimpleNamespace(
+            files=[], verbose=False, outpath=".", name=None, date=True
+        )
+        options_done = False
+
+        i = 0
+        while i < len(argv):
+            arg = argv[i]
+            i += 1
+
+            # Clustered short flags: "-vo PATH" is "-v -o PATH"
+            if (
+                not options_done
+                and len(arg) > 2
+                and arg[0] == "-"
+                and arg[1] in _SHORT_FLAGS
+            ):
+                argv.insert(i, f"-{arg[2:]}")
+                arg = arg[:2]
+
+            if options_done or not _is_option(arg):
+                args.files.append(arg)
+            elif arg == "--":
+                options_done = True
+            elif arg in ("-h", "--help"):
+                self.exit(_HELP)
+            elif arg == "--version":
+                self.exit(f"journaltxt {__version__}\n")
+            elif arg in ("-v", "--verbose"):
+                args.verbose = True
+            elif arg == "--date":
+                args.date = True
+            elif arg == "--no-date":
+                args.date = False
+            else:
+                # Value given as "--output=PATH", "-oPATH", "-o=PATH" or
+                # separately
+                if arg.startswith("--"):
+                    option, has_value, value = arg.partition("=")
+                else:
+                    option, value = arg[:2], arg[2:]
+                    has_value = bool(value)
+                    if value.startswith("="):
+                        value = value[1:]
+
+                if option not in _VALUE_OPTIONS:
+                    self.error(f"unrecognized arguments: {arg}")
+                dest, option_names = _VALUE_OPTIONS[option]
+
+                if not has_value:
+                    if i == len(argv) or _is_option(argv[i]):
+                        self.error(f"argument {option_names}: expected one argument")
+                    value = argv[i]
+                    i += 1
+
+                setattr(args, dest, value)
+
+        if not args.files:
+            args.files = ["journal.txt"]
+
+        return args
+
+    def exit(self, message: str) -> NoReturn:
+        """Print a message to stdout and exit successfully."""
+        sys.stdout.write(message)
+        raise SystemExit(0)
+
+    def error(self, message: str) -> NoReturn:
+        """Print usage and an error message to stderr and exit with code 2."""
+        sys.stderr.write(f"{_USAGE}{self.prog}: error: {message}\n")
+        raise SystemExit(2)
+
+
+def _is_option(arg: str) -> bool:
+    """Check whether an argument is an option rather than a value."""
+    return arg.startswith("-") and arg != "-" and not _NEGATIVE_NUMBER_RE.match(arg)
+
+
+def create_parser() -> CommandLineParser:
     """Create argument parser for journaltxt CLI.
 
     Returns:
-        Configured ArgumentParser instance
+        Configured CommandLineParser instance
     """
-    parser = argparse.ArgumentParser(
-        prog="journaltxt",
-        description="Build Jekyll blog posts from Journal.TXT single-file format",
-        epilog=(
-            "Example: journaltxt -o _posts Vienna.txt\n"
-            "See https://journaltxt.github.io for more information"
-        ),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    parser.add_argument(
-        "files",
-        nargs="*",
-        default=["journal.txt"],
-        metavar="FILE",
-        help="Journal.TXT files to process (default: journal.txt)",
-    )
-
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        action="store_true",
-        help="Show debug messages",
-    )
-
-    parser.add_argument(
-        "-o",
-        "--output",
-        dest="outpath",
-        default=".",
-        metavar="PATH",
-        help="Output directory path (default: .)",
-    )
-
-    parser.add_argument(
-        "-n",
-        "--name",
-        metavar="NAME",
-        help="Journal name (default: derived from filename)",
-    )
-
-    parser.add_argument(
-        "--date",
-        dest="date",
-        action="store_true",
-        default=True,
-        help="Add date to page title (default: true)",
-    )
-
-    parser.add_argument(
-        "--no-date",
-        dest="date",
-        action="store_false",
-        help="Do not add date to page title",
-    )
-
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"journaltxt {__version__}",
-    )
-
-    return parser
+    return CommandLineParser()
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -109,6 +196,9 @@ def main(argv: list[str] | None = None) -> int:
 
     config["date"] = args.date
 
+    # Imported here so that --help and --version skip loading the builder
+    from .builder import build_file
+
     # Process each file
     try:
         for filepath in args.files:
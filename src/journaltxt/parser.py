@@ -1,11 +1,74 @@
 """Parser for Journal.TXT format."""
 
+import contextlib
+import functools
+import json
+import mmap
+import os
 import re
+import stat
+import sys
+from collections.abc import Iterable
 from datetime import date
-from typing import Any
+from pathlib import Path
+from typing import Any, NamedTuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+from .version import __version__
+
+# Separator lines: "---" with optional trailing whitespace
+_FENCE_RE = re.compile(r"^---[ \t]*$", re.MULTILINE)
+_DAY_NUM_RE = re.compile(r"\d+")
+
+# Metadata keys the parser reads and writes; keys loaded from YAML are
+# interned too, so lookups with these match on identity instead of comparing
+# string contents
+_K_YEAR, _K_MONTH, _K_DAY, _K_DATE = map(sys.intern, ("year", "month", "day", "date"))
+
+# Plain scalars SafeLoader resolves to booleans or null
+_PLAIN_WORDS = {
+    **dict.fromkeys(["", "~", "null", "Null", "NULL"]),
+    **dict.fromkeys(["yes", "Yes", "YES", "true", "True", "TRUE"], True),
+    **dict.fromkeys(["on", "On", "ON"], True),
+    **dict.fromkeys(["no", "No", "NO", "false", "False", "FALSE"], False),
+    **dict.fromkeys(["off", "Off", "OFF"], False),
+}
+_PLAIN_INT_RE = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+_UNRESOLVED = object()
+
+# Smaller files are not cached: loading the cache costs about as much as
+# parsing them
+_CACHE_MIN_SIZE = 50 * 1024
+
+# Lowercase full and abbreviated month names to month number
+_MONTHS = {
+    name.lower(): number
+    for number, names in enumerate(
+        [
+            ("January", "Jan"),
+            ("February", "Feb"),
+            ("March", "Mar"),
+            ("April", "Apr"),
+            ("May", "May"),
+            ("June", "Jun"),
+            ("July", "Jul"),
+            ("August", "Aug"),
+            ("September", "Sep"),
+            ("October", "Oct"),
+            ("November", "Nov"),
+            ("December", "Dec"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+
 
 class ParserError(Exception):
     """Exception raised for parsing errors."""
@@ -13,12 +76,29 @@ class ParserError(Exception):
     pass
 
 
+class Entry(NamedTuple):
+    """A parsed journal entry.
+
+    Unpacks like a (metadata_dict, content_string) tuple.
+    """
+
+    meta: dict[str, Any]
+    content: str
+
+    @property
+    def date(self) -> date:
+        """Entry date (same as meta["date"])."""
+        return self.meta[_K_DATE]
+
+
 class Parser:
     """Parser for Journal.TXT single-file format.
 
     Parses journal entries separated by --- delimiters with YAML frontmatter.
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str):
         """Initialize parser with journal text.
 
@@ -27,123 +107,476 @@ class Parser:
         """
         self.text = text
 
-    def parse(self) -> list[tuple[dict[str, Any], str]]:
+    def parse(self) -> list[Entry]:
         """Parse journal text into entries.
 
         Returns:
-            List of tuples containing (metadata_dict, content_string) for each entry
+            List of Entry (metadata_dict, content_string) tuples, one per entry
 
         Raises:
             ParserError: If required fields are missing or invalid
         """
-        # Remove leading first separator --- if present
-        text = re.sub(r"^---[ ]*\n?", "", self.text, count=1)
+        items = self._split()
 
-        # Split on separator lines
-        blocks = re.split(r"^---[ ]*\n?", text, flags=re.MULTILINE)
+        # Parse YAML metadata of all entries
+        metas = _load_metadata([meta_text for meta_text, _ in items])
 
-        # Group into pairs of (metadata, content)
-        items = []
-        for i in range(0, len(blocks), 2):
-            if i + 1 < len(blocks):
-                items.append((blocks[i], blocks[i + 1]))
-            elif blocks[i].strip():  # Handle last block without content
-                items.append((blocks[i], ""))
-
-        # Process metadata blocks
-        last_page_date = None
-        parsed_items = []
-
-        for i, (meta_text, content) in enumerate(items):
-            # Parse YAML metadata
-            try:
-                page_meta = yaml.safe_load(meta_text)
-                if page_meta is None:
-                    page_meta = {}
-            except yaml.YAMLError as e:
-                raise ParserError(f"Invalid YAML in entry {i + 1}: {e}") from e
-
-            # Extract date components
-            year = page_meta.pop("year", None)
-            month = page_meta.pop("month", None)
-            day = page_meta.pop("day", None)
-
-            # Process year
-            if year is None:
-                if last_page_date:
-                    year = last_page_date.year
-                else:
-                    raise ParserError(
-                        f"Entry {i + 1}: year entry required for first entry"
-                    )
-
-            # Process day (required for all entries)
-            if day is None:
-                raise ParserError(f"Entry {i + 1}: day entry required")
-
-            if isinstance(day, str):
-                # Extract numeric day from strings like "Mon 17" or "17"
-                nums_day = re.findall(r"\d+", day)
-                if nums_day:
-                    day = int(nums_day[0])
-                else:
-                    raise ParserError(f"Entry {i + 1}: invalid day format: {day}")
-
-            # Process month
-            if month is None:
-                if last_page_date:
-                    month = last_page_date.month
-                else:
-                    raise ParserError(
-                        f"Entry {i + 1}: month entry required for first entry"
-                    )
-
-            if isinstance(month, str):
-                # Parse month name to number
-                try:
-                    # Try to parse as month name
-                    from datetime import datetime
-
-                    month_str = month.strip()
-                    # Try full month name or abbreviated
-                    for fmt in ["%B", "%b"]:
-                        try:
-                            dt = datetime.strptime(month_str, fmt)
-                            month = dt.month
-                            break
-                        except ValueError:
-                            continue
-                    else:
-                        # If not a month name, might be a number
-                        month = int(month_str)
-                except (ValueError, TypeError) as e:
-                    raise ParserError(
-                        f"Entry {i + 1}: invalid month format: {month}"
-                    ) from e
-
-            # Create date object
-            try:
-                page_date = date(year, month, day)
-            except ValueError as e:
-                raise ParserError(
-                    f"Entry {i + 1}: invalid date ({year}-{month}-{day}): {e}"
-                ) from e
+        return _build_entries(items, metas)
+
+    def _split(self) -> list[tuple[str, str]]:
+        """Split journal text into entry blocks.
+
+        Returns:
+            List of tuples containing (metadata_text, content_string) for each
+            entry
+        """
+        text = self.text.lstrip("\ufeff")
+
+        # Normalize line endings
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-            last_page_date = page_date
-            page_meta["date"] = page_date
+        # Slice the text into blocks between separator lines; each block
+        # keeps the newline that ends its last line
+        blocks = []
+        start = 0
+        for fence in _FENCE_RE.finditer(text):
+            # A leading first separator --- does not end a block
+            if fence.start():
+                blocks.append(text[start : fence.start()])
+            start = fence.end() + 1
+        blocks.append(text[start:])
 
-            parsed_items.append((page_meta, content))
+        # Group into pairs of (metadata, content)
+        items = list(zip(blocks[0::2], blocks[1::2], strict=False))
+        if len(blocks) % 2 and blocks[-1] and not blocks[-1].isspace():
+            # Handle last block without content
+            items.append((blocks[-1], ""))
 
-        return parsed_items
+        return items
 
     @classmethod
-    def parse_text(cls, text: str) -> list[tuple[dict[str, Any], str]]:
+    def parse_text(cls, text: str) -> list[Entry]:
         """Convenience method to parse text directly.
 
         Args:
             text: Journal text in Journal.TXT format
 
         Returns:
-            List of tuples containing (metadata_dict, content_string) for each entry
+            List of Entry (metadata_dict, content_string) tuples, one per entry
         """
         return cls(text).parse()
+
+    @classmethod
+    def parse_texts(cls, texts: Iterable[str]) -> list[list[Entry]]:
+        """Parse several journal texts at once.
+
+        The metadata of all texts is loaded in a single YAML pass, which is
+        faster than parsing many small journals one by one.
+
+        Args:
+            texts: Journal texts in Journal.TXT format
+
+        Returns:
+            List with the parsed entries of each text, as from parse_text
+
+        Raises:
+            ParserError: If required fields are missing or invalid
+        """
+        splits = [cls(text)._split() for text in texts]
+
+        metas = _load_metadata(
+            [meta_text for items in splits for meta_text, _ in items]
+        )
+        text_metas = []
+        start = 0
+        for items in splits:
+            end = start + len(items)
+            text_metas.append(metas[start:end])
+            start = end
+
+        if metas and isinstance(metas[-1], ParserError):
+            # Load text by text so the error names the entry within its text
+            text_metas = [
+                _load_metadata([meta_text for meta_text, _ in items])
+                for items in splits
+            ]
+
+        return [
+            _build_entries(items, entry_metas)
+            for items, entry_metas in zip(splits, text_metas, strict=True)
+        ]
+
+    @classmethod
+    def parse_file(cls, path: str | Path) -> list[Entry]:
+        """Parse a Journal.TXT file.
+
+        Entries parsed from large files are cached as JSON in a
+        ``<file name>.journal.cache.json`` file next to the journal and
+        reused while the journal's modification time and size and the
+        journaltxt version are unchanged. Entries whose metadata does not
+        survive a JSON round trip are not cached.
+
+        Args:
+            path: Path to Journal.TXT file
+
+        Returns:
+            List of Entry (metadata_dict, content_string) tuples, one per entry
+        """
+        path = Path(path)
+        st = path.stat()
+
+        if st.st_size < _CACHE_MIN_SIZE or not stat.S_ISREG(st.st_mode):
+            return cls(_read_text(path)).parse()
+
+        cache_path = path.with_name(path.name + ".journal.cache.json")
+        try:
+            cache = json.loads(cache_path.read_bytes())
+            # Caches written by another version may hold differently parsed
+            # entries
+            if (cache["version"], cache["mtime_ns"], cache["size"]) == (
+                __version__,
+                st.st_mtime_ns,
+                st.st_size,
+            ):
+                return _entries_from_json(cache["entries"])
+        except Exception:
+            # Missing, unreadable or stale-format cache; parse again
+            pass
+
+        items = cls(_read_text(path)).parse()
+
+        try:
+            payload = json.dumps(
+                {
+                    "version": __version__,
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "entries": [
+                        ({**meta, _K_DATE: meta[_K_DATE].isoformat()}, content)
+                        for meta, content in items
+                    ],
+                },
+                ensure_ascii=False,
+            )
+        except (TypeError, ValueError):
+            # Metadata holds values JSON cannot represent (e.g. nested dates)
+            return items
+        if _entries_from_json(json.loads(payload)["entries"]) != items:
+            # JSON changed the metadata (e.g. turned int keys into strings)
+            return items
+
+        # Write to a temporary file first so readers never see a partial cache
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # The cache is only an optimization (e.g. read-only directory or
+            # full disk); don't leave a partly written file behind
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+
+        return items
+
+
+def _entries_from_json(entries: list[list[Any]]) -> list[Entry]:
+    """Rebuild parsed entries from their JSON cache form.
+
+    Args:
+        entries: List of [metadata_dict, content_string] pairs with ISO dates
+
+    Returns:
+        List of Entry (metadata_dict, content_string) tuples, one per entry
+    """
+    items = []
+    for meta, content in entries:
+        meta = {sys.intern(key): value for key, value in meta.items()}
+        meta[_K_DATE] = date.fromisoformat(meta[_K_DATE])
+        items.append(Entry(meta, content))
+    return items
+
+
+def _build_entries(items: list[tuple[str, str]], metas: list[Any]) -> list[Entry]:
+    """Resolve entry dates and pair metadata with content.
+
+    Args:
+        items: (metadata_text, content_string) tuples for each entry
+        metas: Loaded YAML metadata of each entry
+
+    Returns:
+        List of Entry (metadata_dict, content_string) tuples, one per entry
+
+    Raises:
+        ParserError: If required fields are missing or invalid
+    """
+    # Process metadata blocks
+    last_page_date = None
+    parsed_items = [None] * len(items)
+
+    for i, (page_meta, (_, content)) in enumerate(zip(metas, items, strict=True)):
+        if page_meta is None:
+            page_meta = {}
+        elif isinstance(page_meta, ParserError):
+            # Invalid YAML, reported after any errors in earlier entries
+            raise page_meta
+
+        # Extract date components
+        year = page_meta.pop(_K_YEAR, None)
+        month = page_meta.pop(_K_MONTH, None)
+        day = page_meta.pop(_K_DAY, None)
+
+        # Process year
+        if year is None:
+            if last_page_date:
+                year = last_page_date.year
+            else:
+                raise ParserError(f"Entry {i + 1}: year entry required for first entry")
+
+        # Process day (required for all entries)
+        if day is None:
+            raise ParserError(f"Entry {i + 1}: day entry required")
+
+        # Process month
+        if month is None:
+            if last_page_date:
+                month = last_page_date.month
+            else:
+                raise ParserError(
+                    f"Entry {i + 1}: month entry required for first entry"
+                )
+
+        # Create date object
+        try:
+            page_date = _resolve_date(year, month, day)
+        except ValueError as e:
+            raise ParserError(f"Entry {i + 1}: {e}") from e
+
+        last_page_date = page_date
+        page_meta[_K_DATE] = page_date
+
+        parsed_items[i] = Entry(page_meta, content)
+
+    return parsed_items
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _resolve_date(year: int, month: int | str, day: int | str) -> date:
+    """Build an entry date from its year, month and day fields.
+
+    Results are cached, as the same month and day values recur within and
+    across journals.
+
+    Args:
+        year: Year number
+        month: Month number, or full or abbreviated month name
+        day: Day number, or string containing it (e.g. "Mon 17")
+
+    Returns:
+        Entry date
+
+    Raises:
+        ValueError: If the month or day format or the date is invalid
+    """
+    if isinstance(day, str):
+        # Extract numeric day from strings like "Mon 17" or "17", checking
+        # those common forms without the regex first
+        head, _, tail = day.rstrip().rpartition(" ")
+        if tail.isdecimal() and (not head or head.isalpha()):
+            day = int(tail)
+        else:
+            day_num = _DAY_NUM_RE.search(day)
+            if not day_num:
+                raise ValueError(f"invalid day format: {day}")
+            day = int(day_num.group())
+
+    if isinstance(month, str):
+        try:
+            month = _month_to_int(month)
+        except ValueError as e:
+            raise ValueError(f"invalid month format: {month}") from e
+
+    try:
+        return date(year, month, day)
+    except ValueError as e:
+        raise ValueError(f"invalid date ({year}-{month}-{day}): {e}") from e
+
+
+@functools.lru_cache(maxsize=64)
+def _month_to_int(month: str) -> int:
+    """Convert a full or abbreviated month name, or a number, to an int.
+
+    Raises:
+        ValueError: If the month is neither a known name nor a number
+    """
+    month = month.strip()
+    return _MONTHS.get(month.lower()) or int(month)
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 text file, removing BOM if present.
+
+    Regular files are memory-mapped and decoded straight from the mapping;
+    empty files and pipes, FIFOs or procfs files (whose size is not known
+    up front) are read normally.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        File contents
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or not st.st_size:
+            return f.read().decode("utf-8-sig")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8-sig")
+
+
+def _load_metadata(meta_texts: list[str]) -> list[Any]:
+    """Load the YAML metadata blocks of all entries.
+
+    The blocks are loaded as one multi-document stream, which saves setting
+    up a loader per entry, and straight from parser events when they are
+    simple enough (see _load_flat_documents). If that fails, or the
+    documents do not line up with the blocks, each block is loaded on its
+    own so that errors name the offending entry. Mapping keys are interned.
+
+    Invalid YAML is not raised here but left in place of the metadata, so
+    that _build_entries reports errors in entry order.
+
+    Args:
+        meta_texts: YAML metadata block of each entry
+
+    Returns:
+        Loaded metadata of each entry (None for empty blocks); from the first
+        block that is not valid YAML on, a ParserError naming that block
+    """
+    if meta_texts:
+        stream = "".join(f"---\n{meta_text}" for meta_text in meta_texts)
+        try:
+            metas = _load_flat_documents(stream)
+            if metas is None:
+                metas = [
+                    _intern_keys(meta)
+                    for meta in yaml.load_all(stream, Loader=_SafeLoader)
+                ]
+        except yaml.YAMLError:
+            metas = []
+        if len(metas) == len(meta_texts):
+            return metas
+
+    metas = []
+    for i, meta_text in enumerate(meta_texts):
+        try:
+            metas.append(_intern_keys(yaml.load(meta_text, Loader=_SafeLoader)))
+        except yaml.YAMLError as e:
+            error = ParserError(f"Invalid YAML in entry {i + 1}: {e}")
+            error.__cause__ = e
+            metas.extend([error] * (len(meta_texts) - i))
+            break
+    return metas
+
+
+def _intern_keys(meta: Any) -> Any:
+    """Intern the string keys of a loaded metadata mapping.
+
+    Args:
+        meta: Loaded metadata document
+
+    Returns:
+        The document, with interned keys if it is a mapping
+    """
+    if type(meta) is not dict:
+        return meta
+    return {
+        sys.intern(key) if type(key) is str else key: value
+        for key, value in meta.items()
+    }
+
+
+def _load_flat_documents(stream: str) -> list[Any] | None:
+    """Load a stream of flat YAML mappings directly from parser events.
+
+    Handles empty documents and mappings from string keys to scalars or
+    lists of scalars. Plain scalars are resolved like SafeLoader does for
+    integers, booleans, null and strings starting with a letter. Skipping
+    node composition and PyYAML's constructor makes this about twice as
+    fast as yaml.load_all for typical entry metadata.
+
+    Args:
+        stream: YAML stream
+
+    Returns:
+        Loaded documents, or None if the stream holds anything else (nested
+        collections, tags, anchors, dates, floats, ...) and needs a full load
+
+    Raises:
+        yaml.YAMLError: If the stream is not valid YAML
+    """
+    docs = []
+    doc: dict[str, Any] | None = None
+    key: str | None = None
+    seq: list[Any] | None = None
+    in_mapping = False
+
+    for event in yaml.parse(stream, Loader=_SafeLoader):
+        event_type = type(event)
+
+        if event_type is yaml.ScalarEvent:
+            if event.tag is not None or event.anchor is not None:
+                return None
+            value = event.value
+            if event.implicit[0]:
+                # Plain scalar: resolve implicit types
+                value = _PLAIN_WORDS.get(value, _UNRESOLVED)
+                if value is _UNRESOLVED:
+                    value = event.value
+                    if _PLAIN_INT_RE.fullmatch(value):
+                        value = int(value)
+                    elif not value[0].isalpha():
+                        return None
+
+            if seq is not None:
+                seq.append(value)
+            elif not in_mapping:
+                # Only empty (null) documents may be scalars
+                if value is not None:
+                    return None
+            elif key is None:
+                if type(value) is not str:
+                    return None
+                key = sys.intern(value)
+            else:
+                doc[key] = value
+                key = None
+
+        elif event_type is yaml.MappingStartEvent:
+            if in_mapping or event.tag is not None or event.anchor is not None:
+                return None
+            doc = {}
+            in_mapping = True
+
+        elif event_type is yaml.MappingEndEvent:
+            in_mapping = False
+
+        elif event_type is yaml.SequenceStartEvent:
+            if key is None or seq is not None:
+                return None
+            if event.tag is not None or event.anchor is not None:
+                return None
+            seq = []
+
+        elif event_type is yaml.SequenceEndEvent:
+            doc[key] = seq
+            key = seq = None
+
+        elif event_type is yaml.DocumentEndEvent:
+            docs.append(doc)
+            doc = None
+
+        elif event_type is yaml.AliasEvent:
+            return None
+
+    return docs
@@ -0,0 +1,22 @@
+"""Helpers shared by the test modules."""
+
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def read_post(path: Path) -> tuple[dict[str, Any], str]:
+    """Read a built Jekyll post.
+
+    Args:
+        path: Path to the post
+
+    Returns:
+        Tuple of (frontmatter_dict, body_string)
+    """
+    text = path.read_text(encoding="utf-8")
+    _, frontmatter, body = text.split("---", 2)
+    return yaml.load(frontmatter, Loader=_Loader), body
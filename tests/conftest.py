@@ -4,25 +4,39 @@ from pathlib import Path
 
 import pytest
 
+from journaltxt.parser import Entry, Parser
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def data_dir() -> Path:
     """Return path to test data directory."""
     return Path(__file__).parent / "data"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def journal_txt(data_dir: Path) -> str:
     """Load journal.txt test data."""
     return (data_dir / "journal.txt").read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vienna_txt(data_dir: Path) -> str:
     """Load vienna.txt test data."""
     return (data_dir / "vienna.txt").read_text(encoding="utf-8")
 
 
+@pytest.fixture(scope="session")
+def journal_items(data_dir: Path) -> list[Entry]:
+    """Parse journal.txt test data once per test session."""
+    return Parser.parse_file(data_dir / "journal.txt")
+
+
+@pytest.fixture(scope="session")
+def vienna_items(data_dir: Path) -> list[Entry]:
+    """Parse vienna.txt test data once per test session."""
+    return Parser.parse_file(data_dir / "vienna.txt")
+
+
 @pytest.fixture
 def tmp_output(tmp_path: Path) -> Path:
     """Create temporary output directory."""
@@ -2,10 +2,10 @@
 
 from datetime import date
 
-import yaml
-
 from journaltxt.builder import Builder, build, build_file
 
+from ._helpers import read_post
+
 
 def test_builder_defaults():
     """Test Builder default configuration."""
@@ -61,11 +61,7 @@ Content.
     build(text, outpath=str(tmp_output), name="Vienna", date=True)
 
     expected_file = tmp_output / "2017-07-17-vienna.md"
-    content = expected_file.read_text(encoding="utf-8")
-
-    # Parse YAML frontmatter
-    yaml_content = content.split("---")[1]
-    meta = yaml.safe_load(yaml_content)
+    meta, _ = read_post(expected_file)
 
     assert meta["title"] == "Vienna - Day 1 - Mon, 17 Jul"
 
@@ -82,11 +78,7 @@ Content.
     build(text, outpath=str(tmp_output), name="Vienna", date=False)
 
     expected_file = tmp_output / "2017-07-17-vienna.md"
-    content = expected_file.read_text(encoding="utf-8")
-
-    # Parse YAML frontmatter
-    yaml_content = content.split("---")[1]
-    meta = yaml.safe_load(yaml_content)
+    meta, _ = read_post(expected_file)
 
     assert meta["title"] == "Vienna - Day 1"
 
@@ -103,10 +95,7 @@ Content.
     build(text, outpath=str(tmp_output), name="Journal")
 
     expected_file = tmp_output / "2017-07-19-journal.md"
-    content = expected_file.read_text(encoding="utf-8")
-
-    yaml_content = content.split("---")[1]
-    meta = yaml.safe_load(yaml_content)
+    meta, _ = read_post(expected_file)
 
     # Title should not include "Journal -"
     assert not meta["title"].startswith("Journal -")
@@ -140,12 +129,32 @@ Third entry.
     # Verify day numbers in titles
     for day, expected_day_num in [(19, 1), (20, 2), (21, 3)]:
         filepath = tmp_output / f"2017-07-{day}-test.md"
-        content = filepath.read_text(encoding="utf-8")
-        yaml_content = content.split("---")[1]
-        meta = yaml.safe_load(yaml_content)
+        meta, _ = read_post(filepath)
         assert f"Day {expected_day_num}" in meta["title"]
 
 
+def test_build_same_day_keeps_last_entry(tmp_output):
+    """Test that the last of several entries on the same day is written."""
+    text = """---
+year: 2017
+month: 7
+day: 19
+---
+First entry.
+---
+day: 19
+---
+Second entry.
+"""
+    for _ in range(20):
+        build(text, outpath=str(tmp_output), name="Test")
+
+        assert [p.name for p in tmp_output.iterdir()] == ["2017-07-19-test.md"]
+        meta, content = read_post(tmp_output / "2017-07-19-test.md")
+        assert "Day 2" in meta["title"]
+        assert content.strip() == "Second entry."
+
+
 def test_build_preserves_metadata(tmp_output):
     """Test that custom metadata is preserved in output."""
     text = """---
@@ -161,16 +170,43 @@ Content.
     build(text, outpath=str(tmp_output))
 
     expected_file = tmp_output / "2017-07-19-journal.md"
-    content = expected_file.read_text(encoding="utf-8")
-
-    yaml_content = content.split("---")[1]
-    meta = yaml.safe_load(yaml_content)
+    meta, _ = read_post(expected_file)
 
     assert meta["author"] == "John Doe"
     assert meta["tags"] == ["travel", "blog"]
     assert meta["custom"] == "value"
 
 
+def test_build_preserves_metadata_types(tmp_output):
+    """Test that metadata needing quoting or nesting survives the round trip."""
+    text = """---
+year: 2017
+month: 7
+day: 19
+answer: "yes"
+zip: "01234"
+note: "Tip: bring cash # really"
+draft: false
+rating: 4.5
+place: {city: Vienna, country: Austria}
+empty: []
+---
+Content.
+"""
+    build(text, outpath=str(tmp_output))
+
+    expected_file = tmp_output / "2017-07-19-journal.md"
+    meta, _ = read_post(expected_file)
+
+    assert meta["answer"] == "yes"
+    assert meta["zip"] == "01234"
+    assert meta["note"] == "Tip: bring cash # really"
+    assert meta["draft"] is False
+    assert meta["rating"] == 4.5
+    assert meta["place"] == {"city": "Vienna", "country": "Austria"}
+    assert meta["empty"] == []
+
+
 def test_build_file_basic(data_dir, tmp_output):
     """Test build_file with journal.txt."""
     journal_path = data_dir / "journal.txt"
@@ -303,10 +339,7 @@ Content.
     build(text, outpath=str(tmp_output))
 
     expected_file = tmp_output / "2017-07-19-journal.md"
-    content = expected_file.read_text(encoding="utf-8")
-
-    yaml_content = content.split("---")[1]
-    meta = yaml.safe_load(yaml_content)
+    meta, _ = read_post(expected_file)
 
     assert "date" in meta
     assert meta["date"] == date(2017, 7, 19)
@@ -81,6 +81,81 @@ def test_parser_files():
     assert args.files == ["file1.txt", "file2.txt", "file3.txt"]
 
 
+def test_parser_option_value_forms():
+    """Test option values given inline and after --."""
+    parser = create_parser()
+
+    args = parser.parse_args(["--output=_posts", "-nVienna", "--", "-v.txt"])
+    assert args.outpath == "_posts"
+    assert args.name == "Vienna"
+    assert args.verbose is False
+    assert args.files == ["-v.txt"]
+
+
+def test_parser_short_option_forms():
+    """Test "=" after short options and clustered short flags."""
+    parser = create_parser()
+
+    args = parser.parse_args(["-o=_posts", "-n=Vienna"])
+    assert args.outpath == "_posts"
+    assert args.name == "Vienna"
+
+    args = parser.parse_args(["-vo", "_posts", "-vnVienna"])
+    assert args.verbose is True
+    assert args.outpath == "_posts"
+    assert args.name == "Vienna"
+
+
+def test_parser_negative_number_values():
+    """Test that values looking like negative numbers are not options."""
+    parser = create_parser()
+
+    args = parser.parse_args(["-o", "-5", "--name", "-1", "-2.5"])
+    assert args.outpath == "-5"
+    assert args.name == "-1"
+    assert args.files == ["-2.5"]
+
+
+def test_parser_help(capsys):
+    """Test -h/--help flag."""
+    parser = create_parser()
+
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["--help"])
+
+    assert exc_info.value.code == 0
+
+    captured = capsys.readouterr()
+    assert captured.out.startswith("usage: journaltxt")
+    assert "--no-date" in captured.out
+
+
+def test_parser_unknown_option(capsys):
+    """Test that an unknown option is an error."""
+    parser = create_parser()
+
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["--bogus"])
+
+    assert exc_info.value.code == 2
+
+    captured = capsys.readouterr()
+    assert "unrecognized arguments: --bogus" in captured.err
+
+
+def test_parser_missing_option_value(capsys):
+    """Test that an option without its value is an error."""
+    parser = create_parser()
+
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["-o", "-v"])
+
+    assert exc_info.value.code == 2
+
+    captured = capsys.readouterr()
+    assert "argument -o/--output: expected one argument" in captured.err
+
+
 def test_main_basic(data_dir, tmp_output):
     """Test main function with basic arguments."""
     journal_path = str(data_dir / "journal.txt")
@@ -1,10 +1,14 @@
 """Tests for parser module."""
 
+import os
+import threading
 from datetime import date
 
 import pytest
+import yaml
 
-from journaltxt.parser import Parser, ParserError
+from journaltxt import parser as parser_module
+from journaltxt.parser import Entry, Parser, ParserError
 
 
 def test_parser_basic():
@@ -35,6 +39,18 @@ Second entry content.
     assert content2 == "Second entry content.\n"
 
 
+def test_parser_entry():
+    """Test that entries are named (metadata, content) tuples."""
+    items = Parser.parse_text("---\nyear: 2017\nmonth: 7\nday: 19\n---\nText\n")
+
+    entry = items[0]
+    assert isinstance(entry, Entry)
+    assert entry.meta is entry[0]
+    assert entry.content == entry[1] == "Text\n"
+    assert entry.date == date(2017, 7, 19)
+    assert not hasattr(entry, "__dict__")
+
+
 def test_parser_with_day_format():
     """Test parsing with formatted day (e.g., 'Mon 17')."""
     text = """---
@@ -51,6 +67,22 @@ Content here.
     assert meta["date"] == date(2017, 7, 17)
 
 
+def test_parser_day_format_variants():
+    """Test day strings with the number in different positions."""
+    for day in ["17", "Mon 17", "Mon, 17", "17 Mon", "17th", "Montag 17 "]:
+        text = f"""---
+year: 2017
+month: July
+day: "{day}"
+---
+Content here.
+"""
+        items = Parser.parse_text(text)
+
+        meta, _ = items[0]
+        assert meta["date"] == date(2017, 7, 17)
+
+
 def test_parser_month_name():
     """Test parsing with month names."""
     text = """---
@@ -81,6 +113,35 @@ Content.
     assert meta["date"] == date(2017, 7, 15)
 
 
+def test_parser_month_name_variants():
+    """Test month names in any case, with spaces, and numeric strings."""
+    for month in ["JULY", "july", " Jul ", "jUl", "07"]:
+        text = f"""---
+year: 2017
+month: "{month}"
+day: 15
+---
+Content.
+"""
+        items = Parser.parse_text(text)
+
+        meta, _ = items[0]
+        assert meta["date"] == date(2017, 7, 15)
+
+
+def test_parser_invalid_month_format():
+    """Test that an unknown month name raises error."""
+    text = """---
+year: 2017
+month: Juli
+day: 15
+---
+Content.
+"""
+    with pytest.raises(ParserError, match="invalid month format"):
+        Parser.parse_text(text)
+
+
 def test_parser_inherits_year_month():
     """Test that subsequent entries inherit year and month."""
     text = """---
@@ -125,6 +186,52 @@ Content.
     assert meta["date"] == date(2017, 7, 19)
 
 
+def test_parser_interns_metadata_keys():
+    """Test that metadata keys are interned strings."""
+    text = "---\nyear: 2017\nmonth: 7\nday: 19\ncustom_field: x\n---\nContent.\n"
+    meta1, _ = Parser.parse_text(text)[0]
+    meta2, _ = Parser.parse_text(text)[0]
+
+    # Keys loaded from separate texts are one and the same string object
+    (key1,) = (key for key in meta1 if key == "custom_field")
+    (key2,) = (key for key in meta2 if key == "custom_field")
+    assert key1 is key2
+
+
+def test_parser_metadata_types():
+    """Test that metadata values keep their YAML types across entries."""
+    text = """---
+year: 2017
+month: 7
+day: 19
+draft: false
+zip: "01234"
+note:
+tags: [tag1, 2, yes]
+---
+Content.
+---
+day: 20
+---
+More content.
+"""
+    items = Parser.parse_text(text)
+
+    meta, _ = items[0]
+    assert meta["draft"] is False
+    assert meta["zip"] == "01234"
+    assert meta["note"] is None
+    assert meta["tags"] == ["tag1", 2, True]
+
+    # Floats and nested mappings need the full YAML loader
+    text = text.replace("day: 20", "day: 20\nrating: 4.5\nplace: {city: Vienna}")
+    items = Parser.parse_text(text)
+
+    meta, _ = items[1]
+    assert meta["rating"] == 4.5
+    assert meta["place"] == {"city": "Vienna"}
+
+
 def test_parser_missing_year_first_entry():
     """Test that missing year in first entry raises error."""
     text = """---
@@ -187,9 +294,9 @@ Content.
         Parser.parse_text(text)
 
 
-def test_parser_journal_txt(journal_txt):
+def test_parser_journal_txt(journal_items):
     """Test parsing journal.txt fixture."""
-    items = Parser.parse_text(journal_txt)
+    items = journal_items
 
     assert len(items) == 5
     assert items[0][0]["date"] == date(2017, 7, 19)
@@ -199,9 +306,9 @@ def test_parser_journal_txt(journal_txt):
     assert items[4][0]["date"] == date(2017, 7, 23)
 
 
-def test_parser_vienna_txt(vienna_txt):
+def test_parser_vienna_txt(vienna_items):
     """Test parsing vienna.txt fixture."""
-    items = Parser.parse_text(vienna_txt)
+    items = vienna_items
 
     assert len(items) == 3
     assert items[0][0]["date"] == date(2017, 7, 17)
@@ -209,6 +316,27 @@ def test_parser_vienna_txt(vienna_txt):
     assert items[2][0]["date"] == date(2017, 7, 19)
 
 
+def test_parser_parse_texts(journal_txt, vienna_txt):
+    """Test parsing several texts in one batch."""
+    results = Parser.parse_texts([journal_txt, vienna_txt])
+
+    assert results == [Parser.parse_text(journal_txt), Parser.parse_text(vienna_txt)]
+    assert Parser.parse_texts([]) == []
+
+
+def test_parser_parse_texts_invalid_yaml(journal_txt):
+    """Test that invalid YAML in a batch names the entry within its text."""
+    text = """---
+year: 2017
+month: 7
+day: [invalid yaml structure
+---
+Content.
+"""
+    with pytest.raises(ParserError, match="Invalid YAML in entry 1"):
+        Parser.parse_texts([journal_txt, text])
+
+
 def test_parser_class_method():
     """Test Parser class instantiation and parse method."""
     text = """---
@@ -278,3 +406,142 @@ Content.
 """
     with pytest.raises(ParserError, match="Invalid YAML"):
         Parser.parse_text(text)
+
+
+def test_parser_invalid_yaml_names_entry():
+    """Test that invalid YAML in a later entry names that entry."""
+    text = """---
+year: 2017
+month: 7
+day: 19
+---
+Content.
+---
+day: [invalid yaml structure
+---
+More content.
+"""
+    with pytest.raises(ParserError, match="Invalid YAML in entry 2"):
+        Parser.parse_text(text)
+
+
+def test_parser_reports_first_bad_entry():
+    """Test that errors are reported in entry order, YAML or not."""
+    text = """---
+year: 2017
+month: 7
+day: 32
+---
+Content.
+---
+day: [invalid yaml structure
+---
+More content.
+"""
+    with pytest.raises(ParserError, match="Entry 1: invalid date"):
+        Parser.parse_text(text)
+
+    with pytest.raises(ParserError, match="Entry 1: invalid date"):
+        Parser.parse_texts([text])
+
+
+def test_parser_parse_file(data_dir):
+    """Test parsing a file directly."""
+    items = Parser.parse_file(data_dir / "vienna.txt")
+
+    assert len(items) == 3
+    assert items[0][0]["date"] == date(2017, 7, 17)
+    assert not list(data_dir.glob("*.cache.json"))
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_parser_parse_file_fifo(data_dir, tmp_path):
+    """Test parsing from a named pipe, whose size is reported as 0."""
+    fifo_path = tmp_path / "journal.fifo"
+    os.mkfifo(fifo_path)
+
+    def write_journal():
+        with open(fifo_path, "wb") as f:
+            f.write((data_dir / "vienna.txt").read_bytes())
+
+    writer = threading.Thread(target=write_journal)
+    writer.start()
+    try:
+        items = Parser.parse_file(fifo_path)
+    finally:
+        writer.join()
+
+    assert len(items) == 3
+    assert items[0][0]["date"] == date(2017, 7, 17)
+    assert not list(tmp_path.glob("*.cache.json"))
+
+
+def test_parser_parse_file_cache(tmp_path, monkeypatch):
+    """Test that large files are cached and the cache is invalidated."""
+    entry = "---\nday: 19\n---\n" + "Lorem ipsum dolor sit amet.\n" * 2000
+    journal_path = tmp_path / "journal.txt"
+    journal_path.write_text("---\nyear: 2017\nmonth: 7\n" + entry[4:])
+
+    items = Parser.parse_file(journal_path)
+    cache_path = tmp_path / "journal.txt.journal.cache.json"
+    assert cache_path.exists()
+
+    # A cache hit must not parse again
+    with monkeypatch.context() as m:
+        m.setattr(Parser, "parse", None)
+        assert Parser.parse_file(journal_path) == items
+
+    # Caches written by another journaltxt version are not used
+    with monkeypatch.context() as m:
+        m.setattr(parser_module, "__version__", "0.0.0")
+        m.setattr(Parser, "parse", lambda _self: [])
+        assert Parser.parse_file(journal_path) == []
+
+    journal_path.write_text(journal_path.read_text() + entry.replace("19", "20"))
+
+    items = Parser.parse_file(journal_path)
+    assert len(items) == 2
+    assert items[1][0]["date"] == date(2017, 7, 20)
+
+    # Journals differing only in their suffix have separate caches
+    other_path = tmp_path / "journal.md"
+    other_path.write_text(entry.replace("day: 19", "year: 2018\nmonth: 1\nday: 2"))
+    assert Parser.parse_file(other_path)[0][0]["date"] == date(2018, 1, 2)
+    assert (tmp_path / "journal.md.journal.cache.json").exists()
+    assert Parser.parse_file(journal_path) == items
+
+
+def test_parser_parse_file_cache_write_error(tmp_path, monkeypatch):
+    """Test that a failed cache write leaves no temporary file behind."""
+    body = "Lorem ipsum dolor sit amet.\n" * 2000
+    journal_path = tmp_path / "journal.txt"
+    journal_path.write_text(f"---\nyear: 2017\nmonth: 7\nday: 19\n---\n{body}")
+
+    def fail_replace(*_args):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(parser_module.os, "replace", fail_replace)
+    items = Parser.parse_file(journal_path)
+
+    assert items[0][0]["date"] == date(2017, 7, 19)
+    assert [p.name for p in tmp_path.iterdir()] == ["journal.txt"]
+
+
+def test_parser_parse_file_uncacheable_metadata(tmp_path):
+    """Test that metadata JSON cannot represent is parsed but not cached."""
+    body = "Lorem ipsum dolor sit amet.\n" * 2000
+    journal_path = tmp_path / "journal.txt"
+    journal_path.write_text(
+        f"---\nyear: 2017\nmonth: 7\nday: 19\nupdated: 2017-07-20\n---\n{body}"
+    )
+
+    items = Parser.parse_file(journal_path)
+
+    assert items[0][0]["updated"] == date(2017, 7, 20)
+    assert not (tmp_path / "journal.txt.journal.cache.json").exists()
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+def test_parser_uses_libyaml_loader():
+    """Test that metadata is loaded with the libyaml C loader when available."""
+    assert parser_module._SafeLoader is yaml.CSafeLoader
@@ -4,10 +4,12 @@ import re
 
 from journaltxt import __version__, get_banner, get_version
 
+_SEMVER = re.compile(r"^\d+\.\d+\.\d+$")
+
 
 def test_version_format():
     """Test that version follows semantic versioning."""
-    assert re.match(r"^\d+\.\d+\.\d+$", __version__)
+    assert _SEMVER.match(__version__)
 
 
 def test_get_version():